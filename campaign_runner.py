@@ -14,7 +14,6 @@ e Histórico) según el estado del disco.
 import cfg
 import sys
 import json
-import asyncio
 import time
 from pathlib import Path
 from utils import atomic_write_bytes, RequestClient, StatusDevice, ShmStore, ZmqPairController
@@ -39,8 +38,9 @@ class CampaignRunner:
         self.status_obj = StatusDevice(logs_dir=cfg.LOGS_DIR, logger=log)
         self.cli = RequestClient(cfg.API_URL, mac_wifi=cfg.get_mac(), timeout=(5, 15), verbose=cfg.VERBOSE, logger=log)
         self.store = ShmStore()
-        self.campaign_id = self.store.consult_persistent("campaign_id")
-        self.expires_at_ms = self.store.consult_persistent("expires_at_ms")
+        campaign = self.store.consult_many(["campaign_id", "expires_at_ms"])
+        self.campaign_id = campaign["campaign_id"]
+        self.expires_at_ms = campaign["expires_at_ms"]
 
     def _check_expiration(self) -> bool:
         """
@@ -73,7 +73,7 @@ class CampaignRunner:
                 "antenna_port", "ppm_error", "filter", "cooldown_request",
                 "method_psd"]
         try:
-            rf_params = {k: self.store.consult_persistent(k) for k in keys}
+            rf_params = self.store.consult_many(keys)
             if rf_params.get("cooldown_request") is None:
                 rf_params["cooldown_request"] = 1.0
             else:
@@ -159,7 +159,8 @@ class CampaignRunner:
         self.store.add_to_persistent("campaign_runner_running", True)
         try:
             async with ZmqPairController(addr=cfg.IPC_ADDR, is_server=True) as zmq_ctrl:
-                await asyncio.sleep(0.5)
+                # Sin espera fija: con ZMQ_IMMEDIATE, el poll POLLOUT de
+                # send_command solo retorna cuando el motor RF ya está conectado.
                 # AcquireDual aplica la lógica de "patching" para corregir el centro
                 acquirer = AcquireDual(zmq_ctrl, log)
                 log.info(f"Starting Campaign Acquisition ID: {self.campaign_id}")
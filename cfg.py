@@ -105,17 +105,22 @@ def human_readable(ts_ms: int, target_tz: str = "UTC") -> str:
     dt_local = dt_utc.astimezone(ZoneInfo(target_tz))
     return dt_local.strftime('%Y-%m-%d %H:%M:%S')
 
+_MAC_CACHE: str | None = None
+
 def get_mac() -> str:
     """
     Escanea las interfaces de red del sistema para obtener la MAC física.
     
     Ignora interfaces virtuales (docker, loopback, tun) y prioriza 'wlan' 
-    para asegurar una identificación única del hardware del sensor.
+    para asegurar una identificación única del hardware del sensor. La 
+    primera MAC válida se cachea, ya que no cambia durante el arranque.
     
     Returns:
         str: Dirección MAC en formato 'xx:xx:xx:xx:xx:xx'.
     """
+    global _MAC_CACHE
     if DEVELOPMENT: return DUMMY_MAC
+    if _MAC_CACHE is not None: return _MAC_CACHE
     try:
         interfaces = os.listdir("/sys/class/net")
         interfaces.sort(key=lambda x: (not x.startswith("wlan"), x))
@@ -124,7 +129,9 @@ def get_mac() -> str:
             try:
                 with open(f"/sys/class/net/{iface}/address") as f:
                     mac = f.read().strip()
-                if mac and mac != "00:00:00:00:00:00": return mac
+                if mac and mac != "00:00:00:00:00:00":
+                    _MAC_CACHE = mac
+                    return mac
             except OSError: continue
     except Exception: pass
     return "00:00:00:00:00:00"
@@ -146,6 +153,9 @@ class AtomicRotator:
         self.max_files = max_files
         self.current_lines = 0
         self.current_file = self._generate_path()
+        # Contenido ya escrito en current_file: evita releer el archivo en
+        # cada write (None = aún no se ha cargado desde disco).
+        self._content: bytes | None = None
 
     def _generate_path(self) -> pathlib.Path:
         """
@@ -159,11 +169,31 @@ class AtomicRotator:
         
         return LOGS_DIR / f"{timestamp_str}_{self.module_name}.log"
 
+    @staticmethod
+    def _mtime_key(entry: os.DirEntry) -> float:
+        """
+        Clave de antigüedad: última escritura del archivo (st_mtime).
+
+        Se ordena por escritura y no por el nombre: un proceso de larga vida 
+        (orchestrator) sigue escribiendo en el archivo con el nombre más 
+        antiguo, y no debe podarse mientras esté activo.
+        """
+        try:
+            return entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            return 0.0
+
     def _cleanup(self):
+        # Logs/ es compartido con otros procesos (status, campaign_runner...),
+        # así que el orden sale del directorio y no de una cola en memoria.
+        # Solo corre al rotar: un stat por archivo es despreciable.
         try:
-            logs = sorted(list(LOGS_DIR.glob("*.log")), key=lambda x: x.stat().st_mtime)
-            while len(logs) >= self.max_files:
-                logs.pop(0).unlink(missing_ok=True)
+            with os.scandir(LOGS_DIR) as it:
+                logs = [e for e in it if e.name.endswith(".log") and e.is_file(follow_symlinks=False)]
+            logs.sort(key=self._mtime_key)
+            for entry in logs[:max(0, len(logs) - self.max_files + 1)]:
+                try: os.unlink(entry.path)
+                except FileNotFoundError: pass
         except Exception: pass
 
     def write(self, data: str):
@@ -173,21 +203,43 @@ class AtomicRotator:
             self._cleanup()
             self.current_file = self._generate_path()
             self.current_lines = 0
+            self._content = None
         try:
-            content = self.current_file.read_bytes() if self.current_file.exists() else b""
-            atomic_write_bytes(self.current_file, content + data.encode('utf-8'))
+            # Otro proceso pudo podar el archivo en su _cleanup: no se revive
+            # con el contenido en memoria, se empieza de nuevo.
+            if not self.current_file.exists():
+                self._content = b""
+            elif self._content is None:
+                self._content = self.current_file.read_bytes()
+            content = self._content + data.encode('utf-8')
+            # Logs no críticos: sin fsync por línea (menos desgaste de la SD).
+            atomic_write_bytes(self.current_file, content, durable=False)
+            self._content = content
         except Exception: pass
 
     def flush(self): pass
 
 class Tee:
+    """
+    Duplica stderr hacia la consola y el rotador de logs.
+
+    Resuelve una sola vez los métodos `write` de ambos destinos para que cada 
+    escritura (ruta caliente en corridas verbosas) no repita búsquedas de 
+    atributos; `__slots__` evita el dict por instancia.
+    """
+    __slots__ = ("primary", "manager", "_primary_write", "_manager_write")
+
     def __init__(self, primary, manager: AtomicRotator | None):
         self.primary = primary
         self.manager = manager
+        self._primary_write = primary.write
+        self._manager_write = manager.write if manager else None
 
     def write(self, data):
-        self.primary.write(data)
-        if self.manager: self.manager.write(data)
+        if type(data) is not str: data = str(data)
+        self._primary_write(data)
+        if self._manager_write is not None: self._manager_write(data)
+        return len(data)
 
     def flush(self): self.primary.flush()
 
@@ -20,8 +20,6 @@ import os
 import numpy as np
 import re
 import asyncio
-from copy import deepcopy
-import copy
 from utils.dc_spike_removal import DCSpikeRemovalPipeline
 
 def _parse_exec_env(exec_str: str):
@@ -161,7 +159,9 @@ class CronSchedulerCampaign:
         if cmd is None:
             raise ValueError("campaign runner script path is required")
         campaign_argv, _ = _build_python_cmd(self.python_env, cmd)
-        self.cmd = f"systemd-cat -t CAMPAIGN_RUNNER {shlex.join(campaign_argv)}"
+        # cron lanza la línea con /bin/sh -c; `exec` reemplaza ese shell por
+        # systemd-cat para no dejar un proceso sh intermedio que absorba señales.
+        self.cmd = f"exec systemd-cat -t CAMPAIGN_RUNNER {shlex.join(campaign_argv)}"
         self._log = logger if logger else logging.getLogger(__name__)
 
         # Configuración según entorno
@@ -180,8 +180,21 @@ class CronSchedulerCampaign:
         return cfg.human_readable(ts_ms, target_tz="UTC")
 
     def _seconds_to_cron_interval(self, seconds):
+        """
+        Convierte el periodo de adquisición en una expresión cron.
+
+        Menos de una hora usa el campo de minutos (*/N). Desde una hora solo 
+        se aceptan horas enteras que dividan el día (*/1, */2, */3, */4, */6, 
+        */8, */12), porque cron reinicia el conteo a medianoche; cualquier otro 
+        periodo (horas no enteras, >= 24 h) no es representable y retorna None.
+        """
         minutes = max(int(seconds / 60), 1)
-        return f"*/{minutes} * * * *"
+        if minutes < 60:
+            return f"*/{minutes} * * * *"
+        hours, rem = divmod(minutes, 60)
+        if rem == 0 and hours < 24 and 24 % hours == 0:
+            return f"0 */{hours} * * *"
+        return None
 
     def _clear_all_campaign_jobs(self):
         """Limpia todos los jobs con el prefijo CAMPAIGN_."""
@@ -191,10 +204,24 @@ class CronSchedulerCampaign:
         if jobs:
             self._log.debug(f"🧹 Crontab cleared ({len(jobs)} jobs removed)")
 
-    def _upsert_job(self, camp, store: ShmStore):
-        """Actualiza RAM y agenda el job en el sistema operativo."""
+    def _upsert_job(self, camp, store: ShmStore) -> bool:
+        """
+        Actualiza RAM y agenda el job en el sistema operativo.
+
+        Returns:
+            bool: False si el periodo de adquisición no es representable en cron.
+        """
         c_id = camp['campaign_id']
         end_ms = camp['timeframe']['end']
+
+        period_s = camp['acquisition_period_s']
+        schedule = self._seconds_to_cron_interval(period_s)
+        if schedule is None:
+            self._log.error(
+                f"❌ Campaign {c_id}: acquisition_period_s={period_s} is not representable "
+                "in cron (use < 60 min, or whole hours dividing 24). Job not scheduled."
+            )
+            return False
         
         # 1. RAM (ShmStore)
         dict_persist_params = {
@@ -216,10 +243,9 @@ class CronSchedulerCampaign:
         store.update_from_dict(dict_persist_params)
 
         # 2. Cron
-        period_s = camp['acquisition_period_s']
-        schedule = self._seconds_to_cron_interval(period_s)
         job = self.cron.new(command=self.cmd, comment=f"CAMPAIGN_{c_id}")
         job.setall(schedule)
+        return True
 
     def sync_jobs(self, campaigns: list, current_time_ms: int, store: ShmStore) -> bool:
         """
@@ -251,19 +277,30 @@ class CronSchedulerCampaign:
         self._clear_all_campaign_jobs()
 
         winner = None
+        scheduled = False
         if candidates:
             # Seleccionamos la de ID más alto
             winner = max(candidates, key=lambda x: x['campaign_id'])
             self._log.info(f"🏆 Winner: ID {winner['campaign_id']} (Ends: {self._ts_to_human(winner['timeframe']['end'])})")
-            self._upsert_job(winner, store)
+            scheduled = self._upsert_job(winner, store)
         else:
             self._log.info("ℹ️ No active candidates found.")
 
-        # Escribir cambios al sistema
-        self.cron.write()
+        # Escribir cambios al sistema. El CronTab se reutiliza entre ciclos
+        # (evita lanzar `crontab -l` en cada sync); si la escritura falla, se
+        # recarga para que el próximo ciclo parta del estado real del sistema.
+        try:
+            self.cron.write()
+        except Exception as write_err:
+            self._log.error(f"Crontab write failed: {write_err}")
+            try:
+                self.cron = CronTab(user=True)
+            except Exception as reload_err:
+                self._log.error(f"Crontab reload failed: {reload_err}")
+            raise
         self._log.info("="*60)
         
-        return winner is not None
+        return scheduled
 
 
 class AcquireDual:
@@ -291,6 +328,29 @@ class AcquireDual:
         self.POLY_DEGREE = 2
         
 
+    #: Parámetros fijos del pipeline de remoción de DC spike. Se construyen una 
+    #: vez por clase; cada adquisición solo añade `noise_std_db`.
+    _DC_PIPELINE_PARAMS = {
+        "analysis_fraction": 0.05,  # Fracción centrada para análisis
+        "smooth_window": 9,          # Suavizado inicial
+        "slope_smooth_window": 7,    # Suavizado para pendientes
+        "support_bins": 14,          # Bins laterales para reconstrucción
+        "poly_degree": 2,            # Grado del polinomio
+        "min_half_width": 2,         # Semi-ancho mínimo
+    }
+
+    #: Parámetros para la detección de baja ocupación.
+    #: Estos valores pueden ajustarse según necesidades específicas
+    _LOW_CONTENT_PARAMS = {
+        "enable_low_content_expansion": True,
+        "low_content_center_fraction": 0.10,
+        "low_content_exclusion_multiplier": 2.5,
+        "low_content_expand_factor": 3.0,
+        "low_content_mean_median_max_diff_db": 0.11,
+        "low_content_high_tail_sigma_factor": 2.5,
+        "low_content_max_high_tail_fraction": 0.025
+    }
+
     def _apply_dc_correction_to_acquisition(self, acquisition_result):
         """
         Aplica corrección DC usando el nuevo pipeline adaptativo.
@@ -302,39 +362,23 @@ class AcquireDual:
         if "Pxx" not in acquisition_result:
             raise KeyError("No se encontró la llave 'Pxx' en acquisition_result.")
         
-        # Copia profunda para no modificar original
-        out = copy.deepcopy(acquisition_result)
+        # Copia superficial: solo se reasignan llaves de primer nivel, así que 
+        # el original no se modifica sin duplicar la lista Pxx completa.
+        out = dict(acquisition_result)
         pxx = np.asarray(out["Pxx"], dtype=float)
         
         # Determinar noise_std_db basado en tamaño de FFT
         noise_std_db = self._get_noise_std_db(len(pxx))
         
-        # Configurar parámetros para la detección de baja ocupación
-        # Estos valores pueden ajustarse según necesidades específicas
-        low_content_params = {
-            "enable_low_content_expansion": True,
-            "low_content_center_fraction": 0.10,
-            "low_content_exclusion_multiplier": 2.5,
-            "low_content_expand_factor": 3.0,
-            "low_content_mean_median_max_diff_db": 0.11,
-            "low_content_high_tail_sigma_factor": 2.5,
-            "low_content_max_high_tail_fraction": 0.025
-        }
-        
         # Aplicar el nuevo pipeline de remoción de DC spike
         try:
             pxx_filtered, center_idx, repair_slice, debug_info = (
                 DCSpikeRemovalPipeline.remove_dc_spike_adaptive_symmetric(
                     power_dbm=pxx,
-                    analysis_fraction=0.05,  # Fracción centrada para análisis
-                    smooth_window=9,          # Suavizado inicial
-                    slope_smooth_window=7,    # Suavizado para pendientes
-                    support_bins=14,          # Bins laterales para reconstrucción
-                    poly_degree=2,            # Grado del polinomio
-                    min_half_width=2,         # Semi-ancho mínimo
                     debug=False,              # Deshabilitar debug en producción
                     noise_std_db=noise_std_db,
-                    **low_content_params
+                    **self._DC_PIPELINE_PARAMS,
+                    **self._LOW_CONTENT_PARAMS
                 )
             )
             
@@ -364,14 +408,9 @@ class AcquireDual:
             repair_slice=repair_slice,
             debug_info=debug_info,
             params_used={
-                "analysis_fraction": 0.05,
-                "smooth_window": 9,
-                "slope_smooth_window": 7,
-                "support_bins": 14,
-                "poly_degree": 2,
-                "min_half_width": 2,
+                **self._DC_PIPELINE_PARAMS,
                 "noise_std_db": noise_std_db,
-                **low_content_params
+                **self._LOW_CONTENT_PARAMS
             },
             out=out
         )
@@ -12,6 +12,10 @@
 
 /** @brief Buffer global donde el hilo deposita los datos crudos del GPS. */
 char RESPONSE_BUFFER_GPS[UART_BUFFER_SIZE];
+/** @brief Copia tokenizada por @ref GPS_Track; los campos de GPSInfo apuntan aquí. */
+static char GPS_PARSE_BUFFER[UART_BUFFER_SIZE];
+/** @brief Última trama cruda parseada, para omitir lecturas idénticas. */
+static char GPS_LAST_RAW[UART_BUFFER_SIZE];
 /** @brief Delimitadores estándar para tramas NMEA (Coma y símbolo de inicio). */
 const char NMEA_DELIMITERS[3] = "$,";
 
@@ -68,8 +72,69 @@ void close_usart1(gp_uart *s_uart)
     close(s_uart->serial_fd);
 }
 
+/** @brief Cadena vacía para los campos ausentes de una trama GGA cortada. */
+static char GPS_EMPTY_FIELD[1] = "";
+
+/**
+ * @brief Separa en una sola pasada los campos de una trama GGA (sin el '$').
+ * @details A diferencia de strtok, conserva los campos vacíos (",,"), por lo 
+ * que una trama sin fix no desplaza los campos siguientes. La trama termina 
+ * en CR/LF; el checksum es lo que sigue a '*'. Los campos ausentes (trama 
+ * cortada por el tamaño del buffer) quedan como cadena vacía.
+ */
+static void GPS_SplitGGA(char *sentence)
+{
+    char *fields[14];
+    char *checksum = GPS_EMPTY_FIELD;
+    size_t nf = 0;
+    char *p = sentence;
+
+    fields[nf++] = p;
+    for (; *p != '\0' && *p != '\r' && *p != '\n'; p++) {
+        if (*p == ',') {
+            *p = '\0';
+            if (nf < 14) fields[nf++] = p + 1;
+        } else if (*p == '*') {
+            *p = '\0';
+            checksum = p + 1;
+        }
+    }
+    *p = '\0';
+    while (nf < 14) fields[nf++] = GPS_EMPTY_FIELD;
+
+    GPSInfo.Header     = fields[0];
+    GPSInfo.UTC_Time   = fields[1];
+    GPSInfo.Latitude   = fields[2];
+    GPSInfo.LatDir     = fields[3];
+    GPSInfo.Longitude  = fields[4];
+    GPSInfo.LonDir     = fields[5];
+    GPSInfo.Quality    = fields[6];
+    GPSInfo.Satelites  = fields[7];
+    GPSInfo.HDOP       = fields[8];
+    GPSInfo.Altitude   = fields[9];
+    GPSInfo.Units_al   = fields[10];
+    GPSInfo.Undulation = fields[11];
+    GPSInfo.Units_un   = fields[12];
+    GPSInfo.Age        = fields[13];
+    GPSInfo.Cheksum    = checksum;
+}
+
 void GPS_Track(char* GPSData)
 {
+    // Anclamos el parseo en la trama GGA: si el bloque leído arranca con
+    // otra sentencia (RMC, GSV...), los campos quedarían desplazados. Si no
+    // hay GGA se conserva el comportamiento previo (strtok desde el inicio).
+    // El talker ID ocupa dos bytes ($GP, $GN, ...): la trama válida tiene el
+    // '$' exactamente 3 posiciones antes de "GGA,", sin retroceder byte a byte.
+    char *gga = strstr(GPSData, "GGA,");
+    while (gga != NULL && (gga - GPSData < 3 || gga[-3] != '$')) {
+        gga = strstr(gga + 4, "GGA,");
+    }
+    if (gga != NULL) {
+        GPS_SplitGGA(gga - 2);
+        return;
+    }
+
     // Usamos el nuevo nombre de la variable de delimitación
     char *token = strtok(GPSData, NMEA_DELIMITERS);
 
@@ -126,9 +191,17 @@ void* GPSIntHandler(void *arg)
         {            
             memset(RESPONSE_BUFFER_GPS, 0, UART_BUFFER_SIZE); 
             //usleep(100000);           
-            s_uart->recv_buff_cnt = read(s_uart->serial_fd, &RESPONSE_BUFFER_GPS, UART_BUFFER_SIZE); 
-            if(strlen(RESPONSE_BUFFER_GPS) > 30) {
-                GPS_Track(RESPONSE_BUFFER_GPS);
+            // Se deja el último byte en 0 para que el buffer siempre termine en NUL.
+            s_uart->recv_buff_cnt = read(s_uart->serial_fd, &RESPONSE_BUFFER_GPS, UART_BUFFER_SIZE - 1); 
+            // El módulo repite la misma trama mientras no hay un fix nuevo: si
+            // coincide con la última parseada, GPSInfo ya es válido. Se tokeniza
+            // una copia para que los punteros no queden dentro del buffer que
+            // se limpia y reescribe en cada lectura.
+            if(strlen(RESPONSE_BUFFER_GPS) > 30 &&
+               strcmp(RESPONSE_BUFFER_GPS, GPS_LAST_RAW) != 0) {
+                memcpy(GPS_LAST_RAW, RESPONSE_BUFFER_GPS, UART_BUFFER_SIZE);
+                memcpy(GPS_PARSE_BUFFER, RESPONSE_BUFFER_GPS, UART_BUFFER_SIZE);
+                GPS_Track(GPS_PARSE_BUFFER);
             }
             pthread_mutex_lock(&gps_ready_mutex);
             GPSRDY = true;
@@ -85,6 +85,8 @@ void close_usart1(gp_uart *s_uart);
 
 /**
  * @brief Tokeniza una cadena NMEA y asigna los valores a la estructura global GPSInfo.
+ * @details Si el bloque contiene una trama GGA ($GPGGA/$GNGGA), el tokenizado
+ * comienza en ella para no desplazar los campos con otras sentencias.
  * @param GPSData Cadena de texto con la trama cruda recibida.
  */
 void GPS_Track(char* GPSData);
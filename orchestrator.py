@@ -18,7 +18,7 @@ from utils import (
 )
 from functions import (
     format_data_for_upload, CronSchedulerCampaign, GlobalSys, 
-    SysState, AcquireDual
+    SysState, AcquireDual, _build_python_cmd
 )
 
 import sys
@@ -31,8 +31,7 @@ import os
 import shlex
 import signal
 import threading
-import time 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 
 # -----------------------------------------------------------------------------
@@ -48,40 +47,6 @@ class ManagedProc:
     log_thread: threading.Thread
 
 
-def _parse_exec_env(exec_str: str) -> Tuple[List[str], Dict[str, str]]:
-    """
-    Soporta valores como:
-      "/opt/venv/bin/python3"
-      "PYTHONUNBUFFERED=1 /opt/venv/bin/python3"
-    """
-    tokens = shlex.split(exec_str)
-    if not tokens:
-        raise ValueError("cfg.PYTHON_ENV_STR is empty")
-
-    env = os.environ.copy()
-    argv: List[str] = []
-
-    for tok in tokens:
-        if "=" in tok and not argv:
-            k, v = tok.split("=", 1)
-            if k and all(ch not in k for ch in " /\\"):
-                env[k] = v
-                continue
-        argv.append(tok)
-
-    if not argv:
-        raise ValueError(f"Could not parse executable from: {exec_str!r}")
-
-    return argv, env
-
-
-def _build_python_cmd(exec_str: str, script_name: str) -> Tuple[List[str], Dict[str, str]]:
-    base_argv, env = _parse_exec_env(exec_str)
-    argv = [*base_argv, "-u", script_name]
-    return argv, env
-
-
-
 def _read_proc_cmdline(pid: int) -> str:
     try:
         with open(f"/proc/{pid}/cmdline", "rb") as f:
@@ -160,17 +125,20 @@ def cleanup_stale_processes(match_terms: List[str], log: logging.Logger, term_ti
     for pid in pids:
         _kill_pid_or_group(pid, signal.SIGTERM, log)
 
+    # Los PIDs que ya terminaron se descartan en sitio; no se reconstruye
+    # la lista de vivos en cada iteración del sondeo.
     end = time.monotonic() + term_timeout
-    while time.monotonic() < end:
-        alive = [pid for pid in pids if os.path.exists(f"/proc/{pid}")]
-        if not alive:
-            return
+    while pids:
+        for i in range(len(pids) - 1, -1, -1):
+            if not os.path.exists(f"/proc/{pids[i]}"):
+                del pids[i]
+        if not pids or time.monotonic() >= end:
+            break
         time.sleep(0.1)
 
-    alive = [pid for pid in pids if os.path.exists(f"/proc/{pid}")]
-    if alive:
-        log.warning(f"[PROC] Force killing stale processes: {alive}")
-        for pid in alive:
+    if pids:
+        log.warning(f"[PROC] Force killing stale processes: {pids}")
+        for pid in pids:
             _kill_pid_or_group(pid, signal.SIGKILL, log)
 
 
@@ -214,7 +182,9 @@ def start_managed_process(
         bufsize=1,
         universal_newlines=True,
         close_fds=True,
-        preexec_fn=os.setsid,   # new session + new process group
+        # new session + new process group; sin preexec_fn CPython puede
+        # lanzar el hijo con vfork() en lugar de fork() completo.
+        start_new_session=True,
         env=env,
     )
 
@@ -96,27 +96,23 @@ void iq_compensation(signal_iq_t* signal_data)
     meanI /= (double)N;
     meanQ /= (double)N;
 
-    #pragma omp parallel for
-    for (size_t n = 0; n < N; n++) {
-        const double I_n = creal(x[n]) - meanI;
-        const double Q_n = cimag(x[n]) - meanQ;
-        x[n] = I_n + I * Q_n;
-    }
-
     /* =========================================================
-     * 2) Estimación de potencia por rama
+     * 2) Centrado + estimación de potencia y correlación por rama
      * =========================================================
-     * Calculamos:
-     *   pI = sum I[n]^2
-     *   pQ = sum Q[n]^2
-     * para estimar el desbalance de ganancia entre ramas.
+     * En el mismo recorrido que resta la media calculamos:
+     *   pI      = sum I[n]^2
+     *   pQ      = sum Q[n]^2
+     *   crossIQ = sum I[n] * Q[n]
+     * sobre la señal ya centrada.
      */
-    #pragma omp parallel for reduction(+:pI, pQ)
+    #pragma omp parallel for reduction(+:pI, pQ, crossIQ)
     for (size_t n = 0; n < N; n++) {
-        const double I_n = creal(x[n]);
-        const double Q_n = cimag(x[n]);
+        const double I_n = creal(x[n]) - meanI;
+        const double Q_n = cimag(x[n]) - meanQ;
+        x[n] = I_n + I * Q_n;
         pI += I_n * I_n;
         pQ += Q_n * Q_n;
+        crossIQ += I_n * Q_n;
     }
 
     /* Protección ante casos degenerados */
@@ -136,30 +132,18 @@ void iq_compensation(signal_iq_t* signal_data)
      */
     const double gain = sqrt(pI / pQ);
 
-    #pragma omp parallel for
-    for (size_t n = 0; n < N; n++) {
-        const double I_n = creal(x[n]);
-        const double Q_n = cimag(x[n]) * gain;
-        x[n] = I_n + I * Q_n;
-    }
-
     /* =========================================================
-     * 4) Recalcular correlación cruzada después del escalado
+     * 4) Correlación cruzada después del escalado
      * =========================================================
-     * Esta es la mejora clave frente a tu versión original:
-     * crossIQ debe calcularse sobre la señal ya balanceada
-     * en ganancia.
+     * crossIQ debe corresponder a la señal ya balanceada en
+     * ganancia. Como solo Q se escala por g:
      *
-     *   crossIQ = sum I[n] * Q[n]
+     *   sum I[n] * (g * Q[n]) = g * sum I[n] * Q[n]
+     *
+     * así que basta con escalar la suma del paso 2, sin otro
+     * recorrido de la señal.
      */
-    crossIQ = 0.0;
-
-    #pragma omp parallel for reduction(+:crossIQ)
-    for (size_t n = 0; n < N; n++) {
-        const double I_n = creal(x[n]);
-        const double Q_n = cimag(x[n]);
-        crossIQ += I_n * Q_n;
-    }
+    crossIQ *= gain;
 
     /* =========================================================
      * 5) Estimar coeficiente de decorrelación
@@ -175,10 +159,10 @@ void iq_compensation(signal_iq_t* signal_data)
     const double rho = crossIQ / (pI + eps);
 
     /* =========================================================
-     * 6) Decorrelación lineal (corrección aproximada de fase)
+     * 6) Balance de ganancia + decorrelación lineal
      * =========================================================
-     * Aplicamos:
-     *   Q <- Q - rho * I
+     * Aplicamos en una sola escritura:
+     *   Q <- g * Q - rho * I
      *
      * Esto reduce la fuga lineal de I dentro de Q, que suele
      * interpretarse como una aproximación al desbalance de fase
@@ -187,7 +171,7 @@ void iq_compensation(signal_iq_t* signal_data)
     #pragma omp parallel for
     for (size_t n = 0; n < N; n++) {
         const double I_n = creal(x[n]);
-        const double Q_n = cimag(x[n]);
+        const double Q_n = cimag(x[n]) * gain;
         const double Q_corr = Q_n - rho * I_n;
         x[n] = I_n + I * Q_corr;
     }
@@ -302,29 +286,39 @@ int find_params_psd(DesiredCfg_t desired, SDR_cfg_t *hack_cfg, PsdConfig_t *psd_
 }
 
 /**
- * @brief Conversión de densidad de potencia lineal a dBm.
+ * @brief Normalización y conversión de densidad de potencia lineal a dBm.
  *
- * Convierte valores de potencia normalizados (W/Hz) a escala logarítmica dBm,
- * asumiendo una impedancia de carga de 50 Ω:
+ * Aplica el factor de normalización del estimador y convierte los valores
+ * (W/Hz) a escala logarítmica dBm, asumiendo una impedancia de carga de 50 Ω:
  * \f[
  * P_{dBm} = 10 \log_{10}(P_{W} \cdot 1000)
  * \f]
+ * Ambos pasos van en un solo recorrido del arreglo; el orden de operaciones
+ * es el mismo que escalando antes en un bucle aparte.
+ *
+ * @param psd    Arreglo de potencia acumulada (se sobrescribe con dBm).
+ * @param length Número de bins.
+ * @param scale  Factor de normalización (1.0 si no aplica).
  *
  * @note Esta conversión asume que la señal IQ está correctamente escalada.
  * Los valores obtenidos representan potencia relativa al ADC y no potencia
  * RF absoluta sin una calibración del sistema.
  */
-static void convert_to_dbm_inplace(double* psd, int length) {
+static inline double lin_to_dbm(double p, double scale) {
+    // Convert normalized power to Watts (assuming 50 Ohm)
+    double p_watts = (p * scale) / IMPEDANCE_50_OHM;
+
+    // Prevent log(0) or negative values
+    if (p_watts < POWER_FLOOR_WATTS) p_watts = POWER_FLOOR_WATTS;
+
+    // Convert Watts to dBm
+    return 10.0 * log10(p_watts * 1000.0);
+}
+
+static void convert_to_dbm_inplace(double* psd, int length, double scale) {
     #pragma omp parallel for
     for (int i = 0; i < length; i++) {
-        // Convert normalized power to Watts (assuming 50 Ohm)
-        double p_watts = psd[i] / IMPEDANCE_50_OHM;
-        
-        // Prevent log(0) or negative values
-        if (p_watts < POWER_FLOOR_WATTS) p_watts = POWER_FLOOR_WATTS;
-        
-        // Convert Watts to dBm
-        psd[i] = 10.0 * log10(p_watts * 1000.0);
+        psd[i] = lin_to_dbm(psd[i], scale);
     }
 }
 
@@ -434,6 +428,35 @@ static void fftshift(double* data, int n) {
     memcpy(&data[n - half], temp, half * sizeof(double));
 }
 
+/**
+ * @brief fftshift + normalización + conversión a dBm en un solo recorrido.
+ *
+ * Para @p n par el fftshift es un intercambio de mitades: cada hilo lee el
+ * par (i, i + n/2), lo convierte y lo escribe cruzado, sin búfer temporal ni
+ * pasada adicional sobre el espectro. Para @p n impar se conserva la ruta
+ * de dos pasos.
+ *
+ * @param psd   Arreglo de potencia acumulada (se sobrescribe con dBm centrado).
+ * @param n     Número de bins (tamaño de la FFT).
+ * @param scale Factor de normalización (1.0 si no aplica).
+ */
+static void fftshift_to_dbm_inplace(double* psd, int n, double scale) {
+    if (n & 1) {
+        fftshift(psd, n);
+        convert_to_dbm_inplace(psd, n, scale);
+        return;
+    }
+
+    const int half = n / 2;
+    #pragma omp parallel for
+    for (int i = 0; i < half; i++) {
+        const double lo = psd[i];
+        const double hi = psd[i + half];
+        psd[i] = lin_to_dbm(hi, scale);
+        psd[i + half] = lin_to_dbm(lo, scale);
+    }
+}
+
 void execute_welch_psd(signal_iq_t* signal_data, const PsdConfig_t* config, double* f_out, double* p_out) {
     if (!signal_data || !config || !f_out || !p_out) return;
 
@@ -561,14 +584,14 @@ void execute_welch_psd(signal_iq_t* signal_data, const PsdConfig_t* config, doub
         for (int k = 0; k < k_segments; k++) {
             if (!local_plan || !local_fft_in || !local_fft_out || !local_accum) continue;
 
-            size_t start = k * step;
-            
+            /*
+             * k_segments garantiza start + nperseg <= n_signal, así que el
+             * segmento siempre está completo: sin rama por muestra, el bucle
+             * de ventaneo queda lineal y vectorizable.
+             */
+            const double complex *seg = signal + (size_t)k * (size_t)step;
             for (int i = 0; i < nperseg; i++) {
-                if ((start + i) < n_signal) {
-                    local_fft_in[i] = signal[start + i] * window[i];
-                } else {
-                    local_fft_in[i] = 0;
-                }
+                local_fft_in[i] = seg[i] * window[i];
             }
 
             fftw_execute(local_plan);
@@ -591,20 +614,14 @@ void execute_welch_psd(signal_iq_t* signal_data, const PsdConfig_t* config, doub
         }
     }
 
-    // Normalization
+    // Normalization (se aplica dentro de la conversión a dBm)
+    double scale = 1.0;
     if (k_segments > 0 && u_norm > 0) {
-        double scale = 1.0 / (fs * u_norm * k_segments * nperseg);
-        
-        #pragma omp parallel for
-        for (int i = 0; i < nfft; i++) {
-            p_out[i] *= scale;
-        }
+        scale = 1.0 / (fs * u_norm * k_segments * nperseg);
     }
 
-    // Shift zero frequency to center
-    fftshift(p_out, nfft);
-
-    convert_to_dbm_inplace(p_out, nfft);
+    // Shift zero frequency to center + dBm (un solo recorrido)
+    fftshift_to_dbm_inplace(p_out, nfft, scale);
 
     // Generate Frequency Axis
     double df = fs / nfft;
@@ -705,24 +722,38 @@ void execute_pfb_psd(
     // -------------------------------------------------
     // Prototype filter
     // -------------------------------------------------
-    double* h = (double*)malloc(L * sizeof(double));
-    if (!h) return; 
-    generate_kaiser_proto(h, L, KAISER_BETA);
+    /*
+     * Caché por hilo del prototipo Kaiser: solo depende de M (T y beta son
+     * constantes), así que las L evaluaciones de bessi0 se hacen una vez por
+     * tamaño de FFT y no en cada adquisición.
+     */
+    static __thread double *tl_pfb_proto = NULL;
+    static __thread int tl_pfb_proto_m = 0;
+    if (tl_pfb_proto == NULL || tl_pfb_proto_m != M) {
+        double *new_proto = (double*)realloc(tl_pfb_proto, (size_t)L * sizeof(double));
+        if (!new_proto) return;
+        tl_pfb_proto = new_proto;
+        tl_pfb_proto_m = M;
+        generate_kaiser_proto(tl_pfb_proto, L, KAISER_BETA);
+    }
 
-    // Polyphase components
-    double* poly[T];
+    /*
+     * Polyphase components: la fase t son los M coeficientes contiguos
+     * h[t*M .. t*M+M-1], así que basta con apuntar dentro del prototipo.
+     * Como con la ventana Welch, los hilos OpenMP usan estos punteros locales
+     * y no el símbolo TLS del hilo llamador.
+     */
+    const double *h = tl_pfb_proto;
+    const double *poly[T];
     for (int t = 0; t < T; t++) {
-        poly[t] = (double*)malloc(M * sizeof(double));
-        for (int m = 0; m < M; m++) {
-            poly[t][m] = h[t * M + m];
-        }
+        poly[t] = h + (size_t)t * (size_t)M;
     }
 
     // -------------------------------------------------
     // PFB Processing
     // -------------------------------------------------
     int blocks = (N - L) / M;
-    if (blocks <= 0) goto cleanup;
+    if (blocks <= 0) return;
 
     #pragma omp parallel
     {
@@ -816,19 +847,12 @@ void execute_pfb_psd(
     }
 
     // -------------------------------------------------
-    // Normalization
+    // Normalization (se aplica dentro de la conversión a dBm)
     // -------------------------------------------------
     double scale = 1.0 / (blocks * fs * M);
-    
-    #pragma omp parallel for
-    for (int i = 0; i < M; i++) {
-        p_out[i] *= scale;
-    }
-
-    // --- FFT Shift ---
-    fftshift(p_out, M);
 
-    convert_to_dbm_inplace(p_out, M);
+    // --- FFT Shift + dBm (un solo recorrido) ---
+    fftshift_to_dbm_inplace(p_out, M, scale);
 
     // -------------------------------------------------
     // Frequency axis
@@ -839,10 +863,6 @@ void execute_pfb_psd(
     for (int i = 0; i < M; i++) {
         f_out[i] = -fs / 2.0 + i * df;
     }
-
-cleanup:
-    for (int t = 0; t < T; t++) free(poly[t]);
-    free(h);
 }
 
 /** @} */
@@ -13,6 +13,7 @@ import cfg
 import sys
 import os
 import time
+import logging
 
 # Setup Logger
 log = cfg.set_logger()
@@ -48,12 +49,14 @@ def build_status_final_payload(store, device):
     Returns:
         dict: Diccionario formateado con todas las métricas, MAC y timestamp actual.
     """
-    # 1. Delta T
+    # 1. Delta T y última calibración (una sola lectura del almacén)
     try:
-        delta_t_ms = store.consult_persistent("delta_t_ms")
+        persisted = store.consult_many(["delta_t_ms", "last_kal_ms", "cpu_prev_jiffies"])
     except Exception as e:
-        log.error(f"Error reading delta_t_ms from tmp file: {e}")
-        delta_t_ms = 0
+        log.error(f"Error reading persistent vars from tmp file: {e}")
+        persisted = {}
+    delta_t_ms = persisted.get("delta_t_ms", 0)
+    last_kal_ms = persisted.get("last_kal_ms", 0)
 
     # 2. Last NTP Sync (Using the function above)
     # Note: We fetch the raw timestamp here. 
@@ -61,21 +64,25 @@ def build_status_final_payload(store, device):
     last_ntp_raw = get_last_ntp_sync_ms()
     last_ntp_ms = last_ntp_raw if last_ntp_raw is not None else 0
 
-    # 3. Last Calibration
-    try:
-        last_kal_ms = store.consult_persistent("last_kal_ms")
-    except Exception as e:
-        log.error(f"Error reading last_kal_ms from tmp file: {e}")
-        last_kal_ms = 0
+    # 3. Contadores de CPU de la ejecución anterior: el uso se calcula contra
+    # ellos en lugar de dormir entre dos lecturas de /proc/stat.
+    device.seed_cpu_sample(persisted.get("cpu_prev_jiffies"))
 
     # Build Snapshot
-    return device.get_status_snapshot(
+    snapshot = device.get_status_snapshot(
         delta_t_ms=delta_t_ms,
         last_kal_ms=last_kal_ms,
         last_ntp_ms=last_ntp_ms,
         timestamp_ms=cfg.get_time_ms(),
         mac=cfg.get_mac(),
     )
+
+    try:
+        store.add_to_persistent("cpu_prev_jiffies", device.export_cpu_sample())
+    except Exception as e:
+        log.error(f"Error saving cpu counters to tmp file: {e}")
+
+    return snapshot
     
 
 def main() -> int:
@@ -90,25 +97,28 @@ def main() -> int:
     """
     store = ShmStore()
     device = StatusDevice(logs_dir=cfg.LOGS_DIR, logger=log)
-    cli = RequestClient(cfg.API_URL, mac_wifi=cfg.get_mac(),
-                        timeout=(5, 15), verbose=cfg.VERBOSE, logger=log)
 
-    try:
-        metrics_dict = build_status_final_payload(store, device)
-    except Exception:
-        return 0
-
-    log.debug(f"Sending payload: {metrics_dict}")
-
-    # retry up to 10 times, every 0.5s, no logs, finish on success
-    attempts = 0
-    while attempts < 10:
-        rc, _ = cli.post_json(cfg.STATUS_URL, metrics_dict)
-        if rc == 0:
-            log.info(f"Payload sent succesfully after {attempts} attempts")
-            break
-        attempts += 1
-        time.sleep(0.5)
+    with RequestClient(cfg.API_URL, mac_wifi=cfg.get_mac(),
+                       timeout=(5, 15), verbose=cfg.VERBOSE, logger=log) as cli:
+        try:
+            metrics_dict = build_status_final_payload(store, device)
+        except Exception:
+            return 0
+
+        # Guardado: el repr del payload (con la cola de logs) solo se construye
+        # si DEBUG está activo.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Sending payload: %s", metrics_dict)
+
+        # retry up to 10 times, every 0.5s, no logs, finish on success
+        attempts = 0
+        while attempts < 10:
+            rc, _ = cli.post_json(cfg.STATUS_URL, metrics_dict)
+            if rc == 0:
+                log.info(f"Payload sent succesfully after {attempts} attempts")
+                break
+            attempts += 1
+            time.sleep(0.5)
 
     return 0
 
@@ -37,9 +37,15 @@ def main():
         "-n", str(SR), "-a", "1", "-l", "32", "-g", "32", "-r", IQ_FILE
     ], capture_output=True)
 
-    raw = np.fromfile(IQ_FILE, dtype=np.int8)
+    # memmap: el kernel pagina la captura (40 MB a 20 MS/s) bajo demanda en
+    # lugar de copiarla entera a RAM; I/Q se escriben directo en un complex64
+    # preasignado, sin los temporales float32 intermedios.
+    raw = np.memmap(IQ_FILE, dtype=np.int8, mode="r")
+    iq = np.empty(raw.size // 2, dtype=np.complex64)
+    iq.real = raw[0::2]
+    iq.imag = raw[1::2]
+    del raw
     os.remove(IQ_FILE)
-    iq = raw[0::2].astype(np.float32) + 1j * raw[1::2].astype(np.float32)
 
     f, p = sig.welch(iq, fs=SR, nperseg=65536, return_onesided=False)
     f = np.fft.fftshift(f)
@@ -38,11 +38,27 @@ class DCSpikeDetectionUtils:
         """
         Suaviza la señal y construye perfiles izquierdo y derecho
         orientados desde el centro hacia afuera.
-        """
-        x_smooth = SignalProcessingUtils.moving_average_edge(x, smooth_window)
 
-        left_profile = x_smooth[center_idx - analysis_half_width:center_idx + 1][::-1]
-        right_profile = x_smooth[center_idx:center_idx + analysis_half_width + 1]
+        Solo se suaviza la ventana de análisis más `smooth_window // 2` bins 
+        por lado: cada salida de la media móvil depende únicamente de sus 
+        vecinos, así que los perfiles son idénticos a suavizar el espectro 
+        completo (N bins) y el costo pasa a depender de la ventana.
+        """
+        N = len(x)
+        window = smooth_window + 1 if smooth_window % 2 == 0 else smooth_window
+        halo = window // 2
+        lo = max(0, center_idx - analysis_half_width - halo)
+        hi = min(N, center_idx + analysis_half_width + 1 + halo)
+
+        if hi - lo >= window:
+            x_smooth = SignalProcessingUtils.moving_average_edge(x[lo:hi], smooth_window)
+            c = center_idx - lo
+        else:
+            x_smooth = SignalProcessingUtils.moving_average_edge(x, smooth_window)
+            c = center_idx
+
+        left_profile = x_smooth[c - analysis_half_width:c + 1][::-1]
+        right_profile = x_smooth[c:c + analysis_half_width + 1]
 
         return x_smooth, left_profile, right_profile
 
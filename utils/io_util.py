@@ -25,7 +25,7 @@ from typing import Callable
 # Configuración del logger local
 log = logging.getLogger(__name__)
 
-def atomic_write_bytes(target_path: Path, data: bytes) -> None:
+def atomic_write_bytes(target_path: Path, data: bytes, *, durable: bool = True) -> None:
     """
     Escribe datos en una ruta de forma atómica.
 
@@ -33,11 +33,14 @@ def atomic_write_bytes(target_path: Path, data: bytes) -> None:
     o del sistema, esta función escribe primero en un archivo temporal y luego 
     reemplaza el archivo destino en una sola operación del sistema operativo.
 
-    
+    Con `durable=False` se omite el fsync: el reemplazo sigue siendo atómico 
+    para los lectores, pero ante un corte de energía puede perderse la última 
+    versión. Útil para datos no críticos reescritos con frecuencia (logs).
 
     Args:
         target_path (Path): Ruta del archivo final.
         data (bytes): Contenido binario a escribir.
+        durable (bool): Si True (por defecto), sincroniza a disco antes del reemplazo.
 
     Raises:
         Exception: Si ocurre un error durante la escritura, sincronización 
@@ -54,8 +57,9 @@ def atomic_write_bytes(target_path: Path, data: bytes) -> None:
             tmp_name = Path(tmpf.name)
             tmpf.write(data)
             tmpf.flush()
-            # Forzamos al kernel a escribir los datos físicamente en el disco/RAM
-            os.fsync(tmpf.fileno())
+            if durable:
+                # Forzamos al kernel a escribir los datos físicamente en el disco/RAM
+                os.fsync(tmpf.fileno())
 
         # Operación atómica de reemplazo
         if tmp_name:
@@ -134,9 +138,12 @@ class ShmStore:
         with open(self.filepath, 'a+') as f:
             fcntl.flock(f, fcntl.LOCK_EX) # Bloqueo exclusivo
             try:
+                # Un solo write con el codificador en C (json.dump escribe por
+                # fragmentos) y sin espacios: el archivo lo releen Python y cJSON.
+                payload = json.dumps(data, separators=(",", ":"))
                 f.seek(0)
                 f.truncate(0)
-                json.dump(data, f)
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno()) # Persistencia inmediata en RAM
             finally:
@@ -156,8 +163,9 @@ class ShmStore:
             fcntl.flock(f, fcntl.LOCK_EX)
             try:
                 f.seek(0)
+                raw = f.read()
                 try:
-                    current_data = json.load(f)
+                    current_data = json.loads(raw)
                     if not isinstance(current_data, dict):
                         current_data = {}
                 except (json.JSONDecodeError, ValueError):
@@ -165,9 +173,15 @@ class ShmStore:
 
                 updater(current_data)
 
+                # Sin cambios (p. ej. banderas reescritas con el mismo valor):
+                # se evita el truncate + write + fsync. Se compara el texto
+                # serializado, así True frente a 1 sí cuenta como cambio.
+                payload = json.dumps(current_data, separators=(",", ":"))
+                if payload == raw:
+                    return
                 f.seek(0)
                 f.truncate(0)
-                json.dump(current_data, f)
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno())
             finally:
@@ -198,6 +212,19 @@ class ShmStore:
         """
         current_data = self._read_file()
         return current_data.get(key, None)
+
+    def consult_many(self, keys: list) -> dict:
+        """
+        Consulta varias claves con una sola lectura del archivo.
+
+        Args:
+            keys (list): Claves a buscar.
+
+        Returns:
+            dict: Mapa clave -> valor (None si la clave no existe).
+        """
+        current_data = self._read_file()
+        return {k: current_data.get(k, None) for k in keys}
     
     def update_from_dict(self, data_dict: dict):
         """
@@ -224,7 +251,8 @@ class ElapsedTimer:
     Temporizador simple de cuenta regresiva.
 
     Permite verificar si ha transcurrido un intervalo de tiempo determinado 
-    sin bloquear el hilo de ejecución.
+    sin bloquear el hilo de ejecución. Usa el reloj monotónico para que los 
+    saltos de hora por sincronización NTP no adelanten ni retrasen el conteo.
     """
     def __init__(self):
         """Inicializa el tiempo final en cero."""
@@ -237,7 +265,7 @@ class ElapsedTimer:
         Args:
             seconds (float): Segundos a esperar desde este momento.
         """
-        self.end_time = time.time() + seconds
+        self.end_time = time.monotonic() + seconds
 
     def time_elapsed(self) -> bool:
         """
@@ -246,4 +274,4 @@ class ElapsedTimer:
         Returns:
             bool: True si el tiempo actual superó el tiempo objetivo, False si no.
         """
-        return time.time() >= self.end_time
\ No newline at end of file
+        return time.monotonic() >= self.end_time
\ No newline at end of file
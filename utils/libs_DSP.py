@@ -1,6 +1,19 @@
 
 import numpy as np
 
+# Generador compartido del módulo: se crea una sola vez (semilla del SO) y se
+# reutiliza, en vez de sembrar un default_rng() nuevo en cada reconstrucción.
+_RNG = None
+
+
+def _shared_rng():
+    """Devuelve el generador del módulo, creándolo en el primer uso."""
+    global _RNG
+    if _RNG is None:
+        _RNG = np.random.default_rng()
+    return _RNG
+
+
 class SignalProcessingUtils:
     """
     Utilidades de procesamiento de señales para análisis de PSD
@@ -24,7 +37,7 @@ class SignalProcessingUtils:
             return np.zeros(int(n_samples), dtype=float)
 
         if rng is None:
-            rng = np.random.default_rng()
+            rng = _shared_rng()
 
         return rng.normal(loc=0.0, scale=noise_std_db, size=int(n_samples))
 
@@ -9,6 +9,7 @@ comunicación entre procesos (IPC).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple, Dict, Any
 import zmq
 import zmq.asyncio
@@ -17,6 +18,18 @@ import re
 import os
 from dataclasses import dataclass
 
+#: Patrón de MAC precompilado; se evalúa en cada GET.
+_MAC_RE = re.compile(r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$")
+
+#: Descripción por familia de código HTTP (status_code // 100) para el log.
+_RC_MSG = {
+    1: "Respuesta informativa",
+    3: "Redirección no resuelta",
+    4: "Error del cliente",
+    5: "Error del servidor",
+}
+
+
 @dataclass
 class FilterConfig:
     """Configuración de filtrado digital para la señal de RF."""
@@ -95,6 +108,8 @@ class RequestClient:
 
     Esta clase simplifica las peticiones `requests` inyectando automáticamente 
     la dirección MAC en los endpoints y capturando excepciones comunes de red.
+    Reutiliza una única `requests.Session` para mantener la conexión TLS viva 
+    entre peticiones consecutivas al mismo servidor.
 
     Códigos de Retorno (RC):
         * **0**: Éxito (Respuesta HTTP 2xx).
@@ -124,6 +139,11 @@ class RequestClient:
         self.verbose = verbose
         self._log = logger
 
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     def get(
         self,
         endpoint: str,
@@ -171,16 +191,17 @@ class RequestClient:
             if self.verbose and self._log:
                 self._log.info(f"[HTTP] {method} → {url}")
 
-            resp = requests.request(
+            resp = self._session.request(
                 method, url, headers=headers, data=data, 
                 params=params, timeout=self.timeout
             )
 
-            if 200 <= resp.status_code < 300:
+            bucket = resp.status_code // 100
+            if bucket == 2:
                 return 0, resp
 
             if self._log:
-                self._log.error(f"[HTTP] Error rc={resp.status_code} en {url}")
+                self._log.error(f"[HTTP] {_RC_MSG.get(bucket, 'Respuesta desconocida')} rc={resp.status_code} en {url}")
             return 1, resp
 
         except requests.exceptions.ConnectionError as e:
@@ -205,8 +226,17 @@ class RequestClient:
         
     def _is_valid_mac(self) -> bool:
         """Valida el formato de la dirección MAC mediante regex."""
-        pattern = r"^[0-9a-fA-F]{2}(:[0-9a-fA-F]{2}){5}$"
-        return bool(re.match(pattern, self.mac_wifi))
+        return bool(_MAC_RE.match(self.mac_wifi))
+
+    def close(self):
+        """Libera el pool de conexiones de la sesión HTTP."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 class ZmqPairController:
     """
@@ -16,12 +16,47 @@ from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 import time
 import os
+import socket
+import struct
 import subprocess
 import logging
+import weakref
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+
+#: Campos de /proc/meminfo que consume el reporte de estado (valores en kB).
+_MEMINFO_KEYS = (b"MemTotal:", b"MemAvailable:", b"SwapTotal:", b"SwapFree:")
+
+#: Sensor térmico del SoC (miligrados Celsius).
+_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+#: Vigencia de la lectura de /proc/meminfo compartida dentro de un snapshot.
+_MEMINFO_TTL_NS = 100_000_000
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Checksum de Internet (RFC 1071) para el encabezado ICMP."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _close_fds(fds: Dict[str, int]) -> None:
+    """Cierra y olvida los descriptores del mapa (vacía el dict en su lugar)."""
+    while fds:
+        _, fd = fds.popitem()
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
 @dataclass
 class StatusPost:
     """
@@ -133,6 +168,52 @@ class StatusDevice:
         self.disk_path_str = str(disk_path)
         self.logs_dir = logs_dir
 
+        # Capacidades totales: no cambian durante la vida del proceso.
+        self._total_ram_swap: Dict[str, int] | None = None
+        self._total_disk_mb: int | None = None
+
+        # Última lectura de /proc/stat (totales, idle) para calcular la carga sin dormir.
+        self._prev_cpu: tuple | None = None
+
+        # Última lectura de /proc/meminfo: (monotonic_ns, valores).
+        self._meminfo_cache: tuple | None = None
+
+        # Descriptores de /proc y /sys abiertos una sola vez y buffer reutilizado:
+        # cada muestreo es un pread() sin reservar memoria nueva para la lectura.
+        self._proc_fds: Dict[str, int] = {}
+        self._proc_buf = bytearray(16384)
+        self._proc_mv = memoryview(self._proc_buf)
+        # Cierre garantizado al recolectar la instancia o al salir del intérprete.
+        self._fd_finalizer = weakref.finalize(self, _close_fds, self._proc_fds)
+
+    def _pread_proc(self, path: str) -> int:
+        """
+        Lee un pseudo-archivo de /proc o /sys con un único pread() desde el offset 0.
+
+        El kernel regenera el contenido en cada lectura desde el inicio, por lo 
+        que el descriptor se conserva entre muestreos. Leer de una sola vez 
+        evita instantáneas inconsistentes entre líneas.
+
+        Returns:
+            int: Bytes válidos depositados al inicio de `self._proc_buf`.
+        """
+        fd = self._proc_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY)
+            self._proc_fds[path] = fd
+        try:
+            return os.preadv(fd, [self._proc_mv], 0)
+        except OSError:
+            # Descriptor inválido: se reabre en la próxima llamada.
+            self._proc_fds.pop(path, None)
+            os.close(fd)
+            raise
+
+    def _read_proc(self, path: str) -> str:
+        """Igual que `_pread_proc`, pero devuelve el contenido decodificado."""
+        n = self._pread_proc(path)
+        return str(self._proc_mv[:n], "ascii", "ignore")
+
     def get_status_snapshot(self, 
                             delta_t_ms: int,
                             last_kal_ms: int,
@@ -144,7 +225,9 @@ class StatusDevice:
         Genera una captura completa del estado actual del sistema.
 
         Coordina todas las subrutinas de recolección (CPU, RAM, Disco, Red, Logs) 
-        y empaqueta el resultado en el formato estricto definido por StatusPost.
+        y empaqueta el resultado en el formato estricto definido por StatusPost. 
+        El ping y la lectura de logs, que esperan E/S, corren en paralelo con 
+        el muestreo de CPU para que la latencia total sea la del más lento.
 
         Args:
             delta_t_ms (int): Latencia de procesamiento actual.
@@ -157,36 +240,38 @@ class StatusDevice:
         Returns:
             Dict[str, Any]: Snapshot completo serializado como diccionario.
         """
-        snapshot = {}
-
-        # 1. Metadatos estáticos y temporales.
-        snapshot["mac"] = mac
-        snapshot["timestamp_ms"] = timestamp_ms
-        snapshot["delta_t_ms"] = delta_t_ms
-        snapshot["last_kal_ms"] = last_kal_ms
-        snapshot["last_ntp_ms"] = last_ntp_ms
-
-        # 2. CPU: Recolección y aplanamiento.
-        cpu_data = self.get_cpu_percent()
-        cpu_list = cpu_data.get("cpu", [])[:4] 
-        for idx, usage in enumerate(cpu_list):
-            snapshot[f"cpu_{idx}"] = usage
-
-        # 3. Métricas de memoria dinámica.
-        snapshot.update(self.get_ram_swap_mb())
-        snapshot.update(self.get_disk())
-        snapshot.update(self.get_temp_c())
-
-        # 4. Capacidades totales de hardware.
-        totals_mem = self.get_total_ram_swap_mb()
-        snapshot["total_ram_mb"] = totals_mem.get("ram_mb") or 0
-        snapshot["total_swap_mb"] = totals_mem.get("swap_mb") or 0
-        snapshot["total_disk_mb"] = self.get_total_disk().get("disk_mb") or 0
-
-        # 5. Red y Logs.
-        snapshot.update(self.get_ping_latency(ping_ip))
-        _, _, logs_text = self.get_logs()
-        snapshot["logs"] = logs_text
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="status") as pool:
+            ping_future = pool.submit(self.get_ping_latency, ping_ip)
+            logs_future = pool.submit(self.get_logs)
+
+            # Recolección en el hilo principal mientras ping y logs esperan E/S.
+            cpu_list = self.get_cpu_percent().get("cpu", [])[:4]
+            mem = self.get_ram_swap_mb()
+            totals_mem = self.get_total_ram_swap_mb()
+
+            # Un único literal con todas las claves, sin update() intermedios.
+            snapshot = {
+                # 1. Metadatos estáticos y temporales.
+                "mac": mac,
+                "timestamp_ms": timestamp_ms,
+                "delta_t_ms": delta_t_ms,
+                "last_kal_ms": last_kal_ms,
+                "last_ntp_ms": last_ntp_ms,
+                # 2. CPU aplanada por núcleo.
+                **{f"cpu_{idx}": usage for idx, usage in enumerate(cpu_list)},
+                # 3. Métricas dinámicas.
+                "ram_mb": mem["ram_mb"],
+                "swap_mb": mem["swap_mb"],
+                "disk_mb": self.get_disk()["disk_mb"],
+                "temp_c": self.get_temp_c()["temp_c"],
+                # 4. Capacidades totales de hardware.
+                "total_ram_mb": totals_mem.get("ram_mb") or 0,
+                "total_swap_mb": totals_mem.get("swap_mb") or 0,
+                "total_disk_mb": self.get_total_disk().get("disk_mb") or 0,
+                # 5. Red y Logs.
+                "ping_ms": ping_future.result()["ping_ms"],
+                "logs": logs_future.result()[2],
+            }
 
         return StatusPost.from_dict(snapshot).to_dict()
 
@@ -194,123 +279,192 @@ class StatusDevice:
         """
         Calcula el uso de CPU leyendo /proc/stat.
 
-        Realiza dos lecturas de los contadores acumulativos (jiffies) con un 
-        intervalo de espera para calcular el diferencial de carga.
-
-        
+        Calcula el diferencial de carga contra la lectura anterior de los 
+        contadores acumulativos (jiffies), sin dormir. La lectura previa vive en 
+        la instancia y puede sembrarse entre ejecuciones con `seed_cpu_sample`. 
+        Sin lectura previa se reporta 0.0 por núcleo.
 
         Returns:
             Dict[str, List[float]]: Diccionario con la clave 'cpu' y lista de porcentajes.
         """
         def read_cpu_lines():
-            """Lee contadores acumulativos por núcleo desde el kernel."""
+            """
+            Lee contadores acumulativos por núcleo desde el kernel.
+
+            Devuelve dos arreglos paralelos `array('q')` (totales, idle+iowait) 
+            en lugar de una tupla por núcleo; None si no hay lectura.
+            """
             try:
-                with open("/proc/stat", "r") as f:
-                    lines = [l for l in f.readlines() if l.startswith("cpu")]
+                n = self._pread_proc("/proc/stat")
             except Exception:
-                return []
-                
-            parsed = []
-            for l in lines[1:]:  # Ignorar la línea agregada inicial.
-                parts = l.split()
-                if len(parts) < 5:
+                return None
+
+            # Las líneas "cpuN" van justo tras la agregada "cpu ": se recorren 
+            # sobre los bytes crudos y se corta en la primera que no es de CPU 
+            # (intr, ctxt, ...), sin decodificar ni partir el resto del archivo.
+            buf = self._proc_buf
+            totals = array("q")
+            idles = array("q")
+            pos = buf.find(b"\n", 0, n) + 1
+            while 0 < pos < n and buf.startswith(b"cpu", pos):
+                end = buf.find(b"\n", pos, n)
+                if end < 0:
+                    end = n
+                vals = list(map(int, buf[pos:end].split()[1:]))
+                pos = end + 1
+                if len(vals) < 4:
                     continue
-                vals = [int(x) for x in parts[1:]]
-                total = sum(vals)
-                idle = vals[3] + (vals[4] if len(vals) > 4 else 0) # idle + iowait.
-                parsed.append((total, idle))
-            return parsed
+                totals.append(sum(vals))
+                idles.append(vals[3] + (vals[4] if len(vals) > 4 else 0)) # idle + iowait.
+            return (totals, idles) if totals else None
+
+        def usage_between(prev, cur):
+            """Porcentaje de uso por núcleo entre dos lecturas; None si no hubo avance."""
+            # Deltas por índice sobre los arreglos paralelos: con 4 núcleos es 
+            # más barato que importar NumPy en cada arranque del oneshot.
+            prev_t, prev_i = prev
+            cur_t, cur_i = cur
+            usage = []
+            any_progress = False
+            for k in range(len(cur_t)):
+                td = cur_t[k] - prev_t[k]
+                if td > 0:
+                    any_progress = True
+                    usage.append(round(100.0 - 100.0 * (cur_i[k] - prev_i[k]) / td, 3))
+                else:
+                    usage.append(0.0)
+            return usage if any_progress else None
 
         try:
-            prev = read_cpu_lines()
-            if not prev: return {"cpu": []}
-
-            max_tries = 5
-            sleep_s = 1.0
-
-            for _ in range(max_tries):
-                time.sleep(sleep_s)
-                cur = read_cpu_lines()
+            cur = read_cpu_lines()
+            if cur is None: return {"cpu": []}
 
-                if not cur or len(cur) != len(prev):
-                    sleep_s = min(sleep_s * 2.0, 1.5)
-                    continue
+            prev, self._prev_cpu = self._prev_cpu, cur
+            if prev is not None and len(prev[0]) == len(cur[0]):
+                usage = usage_between(prev, cur)
+                if usage is not None: return {"cpu": usage}
 
-                usage = []
-                any_progress = False
-                for (t1, i1), (t2, i2) in zip(prev, cur):
-                    total_delta = t2 - t1
-                    idle_delta = i2 - i1
-
-                    if total_delta > 0:
-                        any_progress = True
-                        pct = (1.0 - (idle_delta / total_delta)) * 100.0
-                        usage.append(round(pct, 3))
-                    else:
-                        usage.append(0.0)
-                
-                if any_progress: return {"cpu": usage}
-                sleep_s = min(sleep_s * 2.0, 1.5)
-            return {"cpu": []}
+            # Sin lectura previa utilizable: 0.0 por núcleo, sin dormir.
+            return {"cpu": [0.0] * len(cur[0])}
         except Exception:
             return {"cpu": []}
 
-    def get_ram_swap_mb(self) -> Dict[str, int]:
+    def export_cpu_sample(self) -> List[List[int]] | None:
+        """Última lectura de /proc/stat como [totales, idle], serializable a JSON."""
+        if self._prev_cpu is None:
+            return None
+        return [list(self._prev_cpu[0]), list(self._prev_cpu[1])]
+
+    def seed_cpu_sample(self, sample: Any) -> None:
         """
-        Obtiene el uso actual de RAM y Swap desde /proc/meminfo.
+        Siembra la lectura previa de /proc/stat (p. ej. persistida por una 
+        ejecución anterior) para que get_cpu_percent no tenga que dormir.
+        Ignora valores con forma inválida.
+        """
+        try:
+            totals, idles = sample
+            if len(totals) != len(idles) or not totals:
+                return
+            self._prev_cpu = (array("q", totals), array("q", idles))
+        except (TypeError, ValueError, OverflowError):
+            return
+
+    def _parse_meminfo(self, n: int) -> tuple:
+        """
+        Extrae los campos de `_MEMINFO_KEYS` de los `n` bytes leídos en el buffer.
+
+        Busca cada clave con bytearray.find sobre los bytes crudos, sin 
+        decodificar el archivo ni recorrerlo línea a línea.
+        """
+        buf = self._proc_buf
+        values = []
+        for key in _MEMINFO_KEYS:
+            i = buf.find(key, 0, n)
+            if i < 0:
+                values.append(None)
+                continue
+            j = buf.find(b"\n", i, n)
+            values.append(int(buf[i + len(key):j if j >= 0 else n].split()[0]))
+        return tuple(values)
+
+    def _read_meminfo_all(self) -> tuple:
+        """
+        Lee de una vez MemTotal, MemAvailable, SwapTotal y SwapFree (en kB).
+
+        El resultado se reutiliza durante `_MEMINFO_TTL_NS`, de modo que 
+        get_ram_swap_mb y get_total_ram_swap_mb en un mismo snapshot comparten 
+        una sola lectura de /proc/meminfo.
 
         Returns:
-            Dict[str, int]: Megabytes en uso para RAM y Swap.
+            tuple: (mem_total, mem_available, swap_total, swap_free); None si falta.
         """
-        mem_total = mem_available = swap_total = swap_free = None
+        now = time.monotonic_ns()
+        cached = self._meminfo_cache
+        if cached is not None and now - cached[0] < _MEMINFO_TTL_NS:
+            return cached[1]
+
+        values = (None, None, None, None)
         for _ in range(3):
             try:
-                with open("/proc/meminfo", "r") as f:
-                    for line in f:
-                        if line.startswith("MemTotal:"): mem_total = int(line.split()[1])
-                        elif line.startswith("MemAvailable:"): mem_available = int(line.split()[1])
-                        elif line.startswith("SwapTotal:"): swap_total = int(line.split()[1])
-                        elif line.startswith("SwapFree:"): swap_free = int(line.split()[1])
-                    if mem_total is not None: break
+                values = self._parse_meminfo(self._pread_proc("/proc/meminfo"))
+                if values[0] is not None: break
             except Exception:
                 time.sleep(0.05)
 
+        if values[0] is not None:
+            self._meminfo_cache = (now, values)
+        return values
+
+    def get_ram_swap_mb(self) -> Dict[str, int]:
+        """
+        Obtiene el uso actual de RAM y Swap desde /proc/meminfo.
+
+        Returns:
+            Dict[str, int]: Megabytes en uso para RAM y Swap.
+        """
+        mem_total, mem_available, swap_total, swap_free = self._read_meminfo_all()
         ram_mb = (mem_total - mem_available) // 1024 if mem_total and mem_available else 0
         swap_mb = (swap_total - swap_free) // 1024 if swap_total and swap_free else 0
         return {"ram_mb": ram_mb, "swap_mb": swap_mb}
 
     def get_total_ram_swap_mb(self) -> Dict[str, int]:
-        """Obtiene las capacidades máximas de RAM y Swap."""
-        mem_total = swap_total = None
-        for _ in range(3):
-            try:
-                with open("/proc/meminfo", "r") as f:
-                    for line in f:
-                        if line.startswith("MemTotal:"): mem_total = int(line.split()[1])
-                        elif line.startswith("SwapTotal:"): swap_total = int(line.split()[1])
-                if mem_total is not None: break
-            except Exception:
-                time.sleep(0.05)
+        """Obtiene las capacidades máximas de RAM y Swap (cacheadas tras la primera lectura)."""
+        if self._total_ram_swap is not None:
+            return dict(self._total_ram_swap)
 
-        return {
+        mem_total, _, swap_total, _ = self._read_meminfo_all()
+        totals = {
             "ram_mb": mem_total // 1024 if mem_total else 0,
             "swap_mb": swap_total // 1024 if swap_total else 0,
         }
+        if mem_total:
+            self._total_ram_swap = totals
+        return dict(totals)
 
     def get_disk(self) -> dict:
-        """Calcula el espacio ocupado en disco mediante statvfs."""
+        """
+        Calcula el espacio ocupado en disco mediante statvfs.
+
+        La misma llamada alimenta la capacidad total cacheada, de modo que 
+        get_total_disk no repite el statvfs.
+        """
         try:
             st = os.statvfs(self.disk_path_str)
             used_mb = ((st.f_blocks - st.f_bfree) * st.f_frsize) // (1024 * 1024)
+            if self._total_disk_mb is None:
+                self._total_disk_mb = (st.f_blocks * st.f_frsize) // (1024 * 1024)
             return {"disk_mb": used_mb}
         except Exception:
              return {"disk_mb": 0}
 
     def get_total_disk(self) -> dict:
-        """Calcula el tamaño total de la partición de disco."""
+        """Calcula el tamaño total de la partición de disco (cacheado tras la primera lectura)."""
+        if self._total_disk_mb is not None:
+            return {"disk_mb": self._total_disk_mb}
         try:
             st = os.statvfs(self.disk_path_str)
             total_mb = (st.f_blocks * st.f_frsize) // (1024 * 1024)
+            self._total_disk_mb = total_mb
             return {"disk_mb": total_mb}
         except Exception:
             return {"disk_mb": 0}
@@ -319,30 +473,73 @@ class StatusDevice:
         """
         Lee la temperatura del procesador desde thermal_zone.
 
+        El descriptor de sysfs se mantiene abierto: cada muestra es un pread().
+
         Returns:
             Dict[str, float]: Temperatura en grados Celsius. -1.0 si falla.
         """
-        path = "/sys/class/thermal/thermal_zone0/temp"
         for _ in range(3):
             try:
-                with open(path, "r") as f:
-                    content = f.read().strip()
-                    if content:
-                        return {"temp_c": int(content) / 1000.0}
+                content = self._read_proc(_TEMP_PATH).strip()
+                if content:
+                    return {"temp_c": int(content) / 1000.0}
             except Exception:
                 time.sleep(0.05)
         return {"temp_c": -1.0}
 
+    def _icmp_ping_ms(self, ip: str, timeout_s: float = 1.0) -> float:
+        """
+        Envía un único echo ICMP por un socket SOCK_DGRAM (ping sin privilegios).
+
+        Returns:
+            float: Latencia en milisegundos o -1.0 si no hubo respuesta a tiempo.
+
+        Raises:
+            OSError: Si el kernel no permite sockets ICMP (net.ipv4.ping_group_range).
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+            seq = int(time.monotonic() * 1000) & 0xFFFF
+            payload = b"ane-status"
+            header = struct.pack("!BBHHH", 8, 0, 0, 0, seq)
+            checksum = _icmp_checksum(header + payload)
+            packet = struct.pack("!BBHHH", 8, 0, checksum, 0, seq) + payload
+
+            # Un solo reloj (monotonic_ns) para el plazo y la medición.
+            t0 = time.monotonic_ns()
+            deadline = t0 + int(timeout_s * 1e9)
+            sock.sendto(packet, (ip, 0))
+            while True:
+                remaining = deadline - time.monotonic_ns()
+                if remaining <= 0:
+                    return -1.0
+                sock.settimeout(remaining / 1e9)
+                try:
+                    data = sock.recv(1024)
+                except socket.timeout:
+                    return -1.0
+                t1 = time.monotonic_ns()
+                # El kernel reescribe el identificador; se valida tipo y secuencia.
+                if len(data) >= 8 and data[0] == 0 and struct.unpack_from("!H", data, 6)[0] == seq:
+                    return (t1 - t0) / 1e6
+
     def get_ping_latency(self, ip: str) -> Dict[str, float]:
         """
         Mide la latencia de red hacia un host remoto.
 
+        Usa un socket ICMP propio para evitar el fork/exec de `ping`; si el 
+        sistema no permite sockets ICMP sin privilegios, recurre al binario.
+
         Args:
             ip (str): Dirección IP o dominio a pinguear.
 
         Returns:
             Dict[str, float]: Tiempo de respuesta en milisegundos.
         """
+        try:
+            return {"ping_ms": round(self._icmp_ping_ms(ip), 3)}
+        except OSError:
+            pass
+
         cmd = ["ping", "-c", "1", "-W", "1", ip]
         try:
             output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
@@ -354,54 +551,86 @@ class StatusDevice:
             pass
         return {"ping_ms": -1.0}
 
+    @staticmethod
+    def _tail_valid_lines(path: Path, n: int,
+                          max_bytes: int = 50000, block: int = 4096) -> List[str]:
+        """
+        Lee un log desde el final, por bloques, hasta reunir `n` líneas válidas.
+
+        Nunca retrocede más de `max_bytes` (evita el 100% de CPU en archivos 
+        enormes). Descarta líneas vacías, las que contienen [[OK]] y cualquier 
+        rastro de "payload", lo que rompe la recursión de payloads en los logs.
+
+        Returns:
+            List[str]: Hasta `n` líneas válidas en orden cronológico.
+        """
+        newest_first: List[str] = []
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            pos = os.fstat(fd).st_size
+            floor = max(0, pos - max_bytes)
+            carry = b""
+            while pos > floor and len(newest_first) < n:
+                step = min(block, pos - floor)
+                pos -= step
+                parts = (os.pread(fd, step, pos) + carry).split(b"\n")
+                # El primer fragmento puede ser una línea cortada por el bloque.
+                carry = parts.pop(0) if pos > 0 else b""
+                for raw in reversed(parts):
+                    # Filtro sobre bytes: solo se decodifican las líneas que se conservan.
+                    if b"[[OK]]" in raw or b"payload" in raw.lower():
+                        continue
+                    line = raw.decode("utf-8", errors="ignore").strip()
+                    if line:
+                        newest_first.append(line)
+                        if len(newest_first) >= n:
+                            break
+        finally:
+            os.close(fd)
+
+        newest_first.reverse()
+        return newest_first
+
     def get_logs(self):
         """
         Extrae las últimas 10 líneas evitando la recursión de payloads.
         """
         result_logs = "Sistema operando normalmente"
         max_lines = 10
-        collected_lines: List[str] = []
-
-        if not self.logs_dir.exists():
-            return None, None, result_logs
+        # Cola acotada: nunca retiene más de `max_lines` líneas en memoria.
+        collected_lines: deque = deque(maxlen=max_lines)
 
+        # os.scandir trae el tipo de archivo en la propia lectura del
+        # directorio: sin stat() extra por entrada ni envoltorios de pathlib.
         log_files = []
-        for p in self.logs_dir.glob("*.log"):
-            try:
-                parts = p.stem.split('_')
-                if len(parts) >= 2:
-                    ts_str = f"{parts[0]}_{parts[1]}"
-                    dt = datetime.strptime(ts_str, "%d-%m-%Y_%H:%M:%S")
-                    log_files.append((dt, p))
-            except (ValueError, IndexError):
-                continue
+        try:
+            with os.scandir(self.logs_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".log") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        parts = entry.name[:-4].split('_')
+                        if len(parts) >= 2:
+                            ts_str = f"{parts[0]}_{parts[1]}"
+                            dt = datetime.strptime(ts_str, "%d-%m-%Y_%H:%M:%S")
+                            log_files.append((dt, entry.path))
+                    except (ValueError, IndexError):
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            return None, None, result_logs
         
         log_files.sort(key=lambda x: x[0], reverse=True)
 
         for _, p in log_files:
             try:
-                # OPTIMIZACIÓN: Si el archivo es enorme, solo leemos el final (últimos 50KB)
-                # Esto evita el 100% de CPU y el calor excesivo
-                file_size = p.stat().st_size
-                with open(p, 'r', encoding="utf-8", errors="ignore") as f:
-                    if file_size > 50000:
-                        f.seek(file_size - 50000)
-                    lines = f.readlines()
-
-                # FILTRO CRÍTICO: Eliminamos [[OK]] y cualquier rastro de "payload"
-                # Esto rompe la recursión y elimina las barras \\\\\\\\
-                valid_lines = [
-                    line.strip() for line in lines 
-                    if "[[OK]]" not in line and "payload" not in line.lower()
-                ]
-                
+                need = max_lines - len(collected_lines)
+                valid_lines = self._tail_valid_lines(p, need)
                 if not valid_lines:
                     continue
 
-                collected_lines = valid_lines + collected_lines
-                
+                # Los archivos van del más nuevo al más viejo: se antepone.
+                collected_lines.extendleft(reversed(valid_lines))
                 if len(collected_lines) >= max_lines:
-                    collected_lines = collected_lines[-max_lines:]
                     break
             except Exception as e:
                 self._log.error(f"Error al leer log {p}: {e}")